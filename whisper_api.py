@@ -3,35 +3,115 @@
 # ------------------------------
 
 import os
-import whisper
+import asyncio
+from faster_whisper import WhisperModel, BatchedInferencePipeline, decode_audio
 import uvicorn
-import nest_asyncio
-from fastapi import FastAPI, File, UploadFile
+from fastapi import FastAPI, File, UploadFile, Query
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse, FileResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
-from pydub import AudioSegment
+import numpy as np
 from datetime import datetime
 import json
+import time
+import re
+import stat
+import struct
 import tempfile
-
-nest_asyncio.apply()
+import threading
+import shutil
+import xxhash
+import aiofiles
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
 
 # ---------------- Settings ----------------
 LANGUAGE = "es"
 MODEL_SIZE = "medium"
-DEVICE = "cpu"
+DEVICE = os.getenv("DEVICE", "cpu")  # "cuda" to run on GPU
+# int8 weights use VNNI dot-products on CPU; on GPU use float16, or int8_float16 when VRAM is tight
+COMPUTE_TYPE = os.getenv("COMPUTE_TYPE", "int8" if DEVICE == "cpu" else "float16")
+DEVICE_INDEX = [int(i) for i in os.getenv("DEVICE_INDEX", "0").split(",")]  # e.g. "0,1" to use two GPUs
+# Model replicas per device (so NUM_WORKERS * len(DEVICE_INDEX) concurrent transcriptions). On CPU the
+# cores are split between replicas, so 1 keeps single-request latency; raise it to trade that for throughput
+NUM_WORKERS = int(os.getenv("NUM_WORKERS", "1" if DEVICE == "cpu" else "2"))
 OUTPUT_DIR = "audio_output"
+SAMPLE_RATE = 16000  # Whisper's native rate; uploads are decoded to this once
 PADDING_SEC = 0.15  # 150 ms padding before and after word
+BATCH_SIZE = int(os.getenv("BATCH_SIZE", "16"))  # VAD chunks decoded in parallel (8 is safer on small machines)
+CACHE_DIR = os.path.join(OUTPUT_DIR, "cache")  # results keyed by upload content hash
+CACHE_MAX_ENTRIES = int(os.getenv("CACHE_MAX_ENTRIES", "256"))  # least recently used entries are evicted past this
+SSE_BATCH_WORDS = 16  # words per SSE "words" frame
+SSE_BATCH_MS = 100  # flush a partial frame once it is this old
+WORKERS = int(os.getenv("WORKERS", "1"))  # each worker loads its own model; keep 1 if model/GPU memory is shared
+
+UNSAFE_WORD_CHARS = re.compile(r"[^\w\-]+")  # Unicode-aware so Spanish letters (ñ, á...) stay in filenames
+WORD_FILE_NAME = re.compile(r"\d{8}_\d{6}_\d{6}_w\d{4,}_.*\.wav")  # names written by save_word_audio
 
 os.makedirs(OUTPUT_DIR, exist_ok=True)
+os.makedirs(CACHE_DIR, exist_ok=True)
+
+# Word WAVs on disk, keyed by path relative to OUTPUT_DIR, so /audio_files never has to walk the tree.
+# The index is per process: with WORKERS > 1 each worker lists only what it wrote (plus the startup scan),
+# and a DELETE clears only the handling worker's copy. /play reads from disk, so it works on any worker.
+audio_index = {}
+OUTPUT_ROOT = os.path.realpath(OUTPUT_DIR)
+
+def audio_key(path):
+    return os.path.relpath(path, OUTPUT_DIR).replace(os.sep, "/")
+
+def index_audio_files():
+    """Warm audio_index with one scandir walk over word WAVs only (uploaded originals are skipped)"""
+    folders = [OUTPUT_DIR]
+    while folders:
+        with os.scandir(folders.pop()) as it:
+            for e in it:
+                if e.is_dir(follow_symlinks=False):
+                    folders.append(e.path)
+                elif e.is_file(follow_symlinks=False) and WORD_FILE_NAME.fullmatch(e.name):
+                    audio_index[audio_key(e.path)] = e.stat().st_mtime
+
+index_audio_files()
+
+# Loaded by the app lifespan, i.e. only in processes that serve requests (not the uvicorn supervisor)
+model = None
+batched_model = None
 
-print("Loading Whisper model...")
-model = whisper.load_model(MODEL_SIZE, device=DEVICE)
-print("✅ Model loaded!")
+def load_model():
+    global model, batched_model
+    print(f"Loading Whisper model ({MODEL_SIZE}, {DEVICE}, {COMPUTE_TYPE})...")
+    model = WhisperModel(
+        MODEL_SIZE,
+        device=DEVICE,
+        device_index=DEVICE_INDEX,
+        compute_type=COMPUTE_TYPE,
+        cpu_threads=max(1, (os.cpu_count() or 1) // NUM_WORKERS),  # split cores between workers instead of oversubscribing
+        num_workers=NUM_WORKERS,
+    )
+    batched_model = BatchedInferencePipeline(model=model)
+
+    # Warm up so the first request doesn't pay for CTranslate2 kernel/allocator setup. Silence has no
+    # speech for VAD to keep, so bypass it to push the clip through encode, generate and word alignment;
+    # the second call only runs (and lazily loads) the Silero VAD model
+    warmup_audio = np.zeros(SAMPLE_RATE, dtype=np.float32)
+    run_transcription(warmup_audio, vad_filter=False)
+    run_transcription(warmup_audio)
+    print("✅ Model loaded!")
+
+# Word WAV writes are small and IO-bound, so they overlap well on threads
+executor = ThreadPoolExecutor(max_workers=os.cpu_count())
+# One thread per model replica (NUM_WORKERS on each device), each request freeing its slot when done
+model_executor = ThreadPoolExecutor(max_workers=NUM_WORKERS * len(DEVICE_INDEX))
 
 # ---------------- FastAPI ----------------
-app = FastAPI()
+@asynccontextmanager
+async def lifespan(app):
+    load_model()
+    yield
+    model_executor.shutdown(wait=False, cancel_futures=True)
+    executor.shutdown(wait=False)
+
+app = FastAPI(lifespan=lifespan)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],  # adjust for production
@@ -42,65 +122,258 @@ app.add_middleware(
 # Serve audio files statically
 app.mount("/audio", StaticFiles(directory=OUTPUT_DIR), name="audio")
 
+# ---------------- Transcription Queue ----------------
+async def transcribe_queued(audio):
+    """Queue decoded audio on model_executor and wait for its result without blocking the event loop"""
+    # Each request holds a model worker only for its own transcription; extra requests wait in the executor queue
+    return await asyncio.wrap_future(model_executor.submit(run_transcription, audio))
+
 # ---------------- Helper Functions ----------------
-def save_word_audio(audio_segment, word_index, word_text):
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
-    safe_word = "".join(c for c in word_text[:20] if c.isalnum() or c in ("-", "_")).replace(" ", "_") or "word"
-    filename = f"{timestamp}_word{word_index}_{safe_word}.wav"
-    path = os.path.join(OUTPUT_DIR, filename)
-    audio_segment.export(path, format="wav")
+def run_transcription(audio, vad_filter=True):
+    """Transcribe with faster-whisper and return an openai-whisper shaped result dict"""
+    seg_iter, info = batched_model.transcribe(
+        audio,
+        language=LANGUAGE,
+        task="transcribe",
+        word_timestamps=True,
+        batch_size=BATCH_SIZE,
+        vad_filter=vad_filter,
+    )
+    segments = []
+    for seg in seg_iter:  # segments are generated lazily while decoding
+        segments.append({
+            "id": seg.id,
+            "start": seg.start,
+            "end": seg.end,
+            "text": seg.text,
+            "words": [
+                {"word": w.word, "start": w.start, "end": w.end, "probability": w.probability}
+                for w in (seg.words or [])
+            ],
+        })
+    return {
+        "text": "".join(seg["text"] for seg in segments),
+        "segments": segments,
+        "language": info.language,
+    }
+
+def to_pcm16(audio):
+    """Convert decoded float32 samples to the int16 buffer word clips are cut from"""
+    return (np.clip(audio, -1.0, 1.0) * 32767).astype("<i2")
+
+def wav_header(num_samples, sample_rate):
+    """44-byte RIFF header for 16-bit mono PCM; only the two size fields vary per clip"""
+    data_size = num_samples * 2
+    return struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF", 36 + data_size, b"WAVE",
+        b"fmt ", 16, 1, 1, sample_rate, sample_rate * 2, 2, 16,
+        b"data", data_size,
+    )
+
+def save_word_audio(samples, sample_rate, word_index, word_text, folder, base_ts):
+    """Write a slice of the int16 PCM buffer as a WAV inside folder (header + raw bytes, no encoder)"""
+    safe_word = UNSAFE_WORD_CHARS.sub("", word_text[:20]) or "word"
+    filename = f"{base_ts}_w{word_index:04d}_{safe_word}.wav"  # index keeps names unique within the request
+    path = os.path.join(folder, filename)
+    with open(path, "wb") as f:
+        f.write(wav_header(len(samples), sample_rate))
+        f.write(memoryview(samples))  # the slice is a view into pcm, so this doesn't copy it
+    audio_index[audio_key(path)] = time.time()
     print(f"Saved word audio: {filename}")
     return filename
 
+def load_cached_result(key):
+    """Return the cached text/words for an upload hash, or None on a miss"""
+    json_path = os.path.join(CACHE_DIR, f"{key}.json")
+    try:
+        with open(json_path) as f:
+            cached = json.load(f)
+        os.utime(json_path)  # mark as recently used (atime may not update on noatime mounts)
+    except (FileNotFoundError, ValueError):  # evicted meanwhile, or unreadable
+        return None
+    return cached
+
+cache_lock = threading.Lock()  # store/evict run on worker threads; serialise them within this process
+
+def write_cache_entry(json_path, cached):
+    fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR, suffix=".tmp")  # unique, so other workers can't collide
+    with os.fdopen(fd, "w") as f:
+        json.dump(cached, f)
+    os.replace(tmp_path, json_path)
+
+def store_cached_result(key, upload_folder, full_text, words_info):
+    """Record the upload's result JSON atomically; its word WAVs stay where clients were already sent them"""
+    json_path = os.path.join(CACHE_DIR, f"{key}.json")
+    folder = os.path.basename(upload_folder)
+    with cache_lock:
+        try:
+            with open(json_path) as f:
+                existing = json.load(f)
+        except (FileNotFoundError, ValueError):
+            existing = None
+        if existing is not None:
+            # A concurrent upload of the same clip was cached first. This upload's client already has URLs
+            # into its own folder, so keep the folder but attach it to the winner's entry for eviction
+            existing.setdefault("extra_folders", []).append(folder)
+            write_cache_entry(json_path, existing)
+            return
+        write_cache_entry(json_path, {"text": full_text, "folder": folder, "words": words_info})
+        evict_cache()
+
+def cache_entry_atime(entry):
+    try:
+        return entry.stat().st_atime
+    except FileNotFoundError:  # evicted by another worker process
+        return 0.0
+
+def evict_cache():
+    """Drop the least recently used cache entries (and their word folders) beyond CACHE_MAX_ENTRIES; call with cache_lock held"""
+    with os.scandir(CACHE_DIR) as it:
+        entries = [e for e in it if e.name.endswith(".json")]
+    if len(entries) <= CACHE_MAX_ENTRIES:
+        return
+    entries.sort(key=cache_entry_atime)  # DirEntry caches the stat; on Windows it comes from readdir
+    for e in entries[:len(entries) - CACHE_MAX_ENTRIES]:
+        try:
+            with open(e.path) as f:
+                cached = json.load(f)
+            folders = [cached["folder"], *cached.get("extra_folders", [])]
+        except (OSError, ValueError, KeyError):
+            folders = []
+        try:
+            os.remove(e.path)
+        except FileNotFoundError:
+            continue  # another worker process evicted it and owns the folder cleanup
+        for folder in folders:
+            shutil.rmtree(os.path.join(OUTPUT_DIR, folder), ignore_errors=True)
+            prefix = f"{folder}/"
+            for rel_path in [p for p in list(audio_index) if p.startswith(prefix)]:  # snapshot; writer threads add keys
+                del audio_index[rel_path]
+
+def clear_output_dir():
+    """Delete everything under OUTPUT_DIR (word folders and cache), keeping the directory itself"""
+    with os.scandir(OUTPUT_DIR) as it:
+        for e in it:
+            if e.is_dir(follow_symlinks=False):
+                shutil.rmtree(e.path, ignore_errors=True)
+            else:
+                os.remove(e.path)
+    os.makedirs(CACHE_DIR, exist_ok=True)
+
+def words_event(items):
+    return f"data: {json.dumps({'status': 'words', 'items': items})}\n\n"
+
+async def save_upload(upload, path):
+    """Stream an upload to disk in 1 MiB chunks and return its xxh3-128 content hash"""
+    hasher = xxhash.xxh3_128()
+    async with aiofiles.open(path, "wb") as f:
+        while chunk := await upload.read(1 << 20):
+            hasher.update(chunk)
+            await f.write(chunk)
+    return hasher.hexdigest()
+
+async def split_word_audio(audio, segments, folder, base_ts, words_info):
+    """Write one padded WAV per word into folder, filling words_info and yielding each index as its file lands"""
+    # Build the int16 copy only now, so it isn't held in memory while the model runs
+    pcm = to_pcm16(audio) if any(seg.get("words") for seg in segments) else None
+    duration_samples = len(audio)
+    word_slices = []
+
+    for seg in segments:
+        for w in seg.get("words", []):
+            start = max(int((w["start"] - PADDING_SEC) * SAMPLE_RATE), 0)
+            end = min(int((w["end"] + PADDING_SEC) * SAMPLE_RATE), duration_samples)
+            words_info.append({
+                "index": len(words_info),
+                "word": w["word"].strip(),
+                "start": w["start"],
+                "end": w["end"],
+                "url": None,  # filled in once the WAV is written
+            })
+            word_slices.append(pcm[start:end])
+
+    loop = asyncio.get_running_loop()
+
+    async def write_word(info, samples):
+        word_filename = await loop.run_in_executor(
+            executor, save_word_audio, samples, SAMPLE_RATE, info["index"], info["word"], folder, base_ts
+        )
+        info["url"] = f"/audio/{os.path.basename(folder)}/{word_filename}"
+        return info["index"]
+
+    for done in asyncio.as_completed([write_word(info, samples) for info, samples in zip(words_info, word_slices)]):
+        yield await done
+
 @app.post("/transcribe_sse")
-async def transcribe_audio_sse(file: UploadFile = File(...)):
-    # Read the entire upload immediately
-    content = await file.read()
+async def transcribe_audio_sse(file: UploadFile = File(...), split_words: bool = Query(True)):
+    # Create a unique folder for this upload
+    timestamp_folder = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+    safe_name = "".join(c for c in file.filename if c.isalnum() or c in ("-", "_", "."))
+    upload_folder = os.path.join(OUTPUT_DIR, f"{timestamp_folder}_{safe_name}")
+    os.makedirs(upload_folder, exist_ok=True)
+
+    # Stream the upload to disk now; it is closed once the response starts
+    save_path = os.path.join(upload_folder, safe_name)
+    cache_key = await save_upload(file, save_path)
 
     async def event_generator():
         # Notify received
         yield f"data: {json.dumps({'status': 'received', 'filename': file.filename})}\n\n"
 
-        # Create a unique folder for this upload
-        timestamp_folder = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
-        safe_name = "".join(c for c in file.filename if c.isalnum() or c in ("-", "_", "."))
-        upload_folder = os.path.join(OUTPUT_DIR, f"{timestamp_folder}_{safe_name}")
-        os.makedirs(upload_folder, exist_ok=True)
+        async def replay_cached(cached):
+            await asyncio.to_thread(shutil.rmtree, upload_folder, ignore_errors=True)
+            words = cached["words"] if split_words else []
+            for i in range(0, len(words), SSE_BATCH_WORDS):
+                yield words_event([
+                    {"index": info["index"], "word": info["word"], "url": info["url"]}
+                    for info in words[i:i + SSE_BATCH_WORDS]
+                ])
+            yield f"data: {json.dumps({'status': 'done', 'text': cached['text'], 'words_count': len(words), 'cached': True})}\n\n"
+
+        # Same clip uploaded before: replay its events without touching the model
+        cached = await asyncio.to_thread(load_cached_result, cache_key)
+        if cached is not None:
+            async for event in replay_cached(cached):
+                yield event
+            return
 
-        # Save original file inside its folder
-        save_path = os.path.join(upload_folder, safe_name)
-        with open(save_path, "wb") as f:
-            f.write(content)
         yield f"data: {json.dumps({'status': 'saved', 'path': save_path})}\n\n"
 
-        # Load audio
-        audio = AudioSegment.from_file(save_path)
+        # Decode once to 16 kHz mono; the model gets this float array directly
+        audio = await asyncio.to_thread(decode_audio, save_path, sampling_rate=SAMPLE_RATE)
         yield f"data: {json.dumps({'status': 'transcription_started'})}\n\n"
 
         # Transcribe
-        result = model.transcribe(save_path, language=LANGUAGE, task="transcribe", word_timestamps=True)
+        result = await transcribe_queued(audio)
         full_text = result.get("text", "").strip()
         segments = result.get("segments", [])
 
         words_info = []
-        word_counter = 0
-
-        for seg in segments:
-            for w in seg.get("words", []):
-                word_text = w["word"].strip()
-                start_ms = max(int((w["start"] - PADDING_SEC) * 1000), 0)
-                end_ms = min(int((w["end"] + PADDING_SEC) * 1000), len(audio))
-                word_audio = audio[start_ms:end_ms]
-                word_filename = save_word_audio(word_audio, word_counter, word_text, upload_folder)
-                words_info.append({
-                    "index": word_counter,
-                    "word": word_text,
-                    "start": w["start"],
-                    "end": w["end"],
-                    "url": f"/audio/{os.path.basename(upload_folder)}/{word_filename}"
-                })
-                yield f"data: {json.dumps({'status': 'word_processed', 'word_index': word_counter})}\n\n"
-                word_counter += 1
+        if split_words:
+            # A concurrent upload of the same clip may have finished while we transcribed; reuse its words
+            cached = await asyncio.to_thread(load_cached_result, cache_key)
+            if cached is not None:
+                async for event in replay_cached(cached):
+                    yield event
+                return
+
+            # Report words as their files land, grouped so each frame carries up to SSE_BATCH_WORDS of them
+            batch = []
+            last_flush = time.monotonic()
+            async for word_index in split_word_audio(audio, segments, upload_folder, timestamp_folder, words_info):
+                info = words_info[word_index]
+                batch.append({"index": word_index, "word": info["word"], "url": info["url"]})
+                if len(batch) >= SSE_BATCH_WORDS or time.monotonic() - last_flush >= SSE_BATCH_MS / 1000:
+                    yield words_event(batch)
+                    batch = []
+                    last_flush = time.monotonic()
+            if batch:
+                yield words_event(batch)
+            try:
+                await asyncio.to_thread(store_cached_result, cache_key, upload_folder, full_text, words_info)
+            except OSError as e:  # caching is best effort; the client still gets its done event
+                print(f"Could not cache result {cache_key}: {e}")
 
         yield f"data: {json.dumps({'status': 'done', 'text': full_text, 'words_count': len(words_info)})}\n\n"
 
@@ -108,27 +381,34 @@ async def transcribe_audio_sse(file: UploadFile = File(...)):
 
 
 @app.post("/transcribe")
-async def transcribe_audio(file: UploadFile = File(...)):
-    """Fallback endpoint for non-SSE transcription"""
+async def transcribe_audio(file: UploadFile = File(...), split_words: bool = Query(False)):
+    """Fallback endpoint for non-SSE transcription; split_words=true also writes per-word WAVs"""
     try:
-        # Read the uploaded file
-        content = await file.read()
-        
-        # Save to temporary file
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".wav") as temp_file:
-            temp_file.write(content)
-            temp_path = temp_file.name
+        # Stream the upload into a temporary directory; it is removed on exit even if transcription fails
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = os.path.join(temp_dir, "in.wav")
+            await save_upload(file, temp_path)
 
-        # Transcribe
-        result = model.transcribe(temp_path, language=LANGUAGE, task="transcribe", word_timestamps=True)
-        
-        # Clean up
-        os.unlink(temp_path)
-        
-        return JSONResponse({
+            # Decode off the model pool so a model slot is only held for inference
+            audio = await asyncio.to_thread(decode_audio, temp_path, sampling_rate=SAMPLE_RATE)
+            result = await transcribe_queued(audio)
+
+        response = {
             "text": result.get("text", "").strip(),
             "segments": result.get("segments", [])
-        })
+        }
+
+        if split_words:
+            timestamp_folder = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+            safe_name = "".join(c for c in file.filename if c.isalnum() or c in ("-", "_", "."))
+            words_folder = os.path.join(OUTPUT_DIR, f"{timestamp_folder}_{safe_name}")
+            os.makedirs(words_folder, exist_ok=True)
+            words_info = []
+            async for _ in split_word_audio(audio, response["segments"], words_folder, timestamp_folder, words_info):
+                pass
+            response["words"] = words_info
+
+        return JSONResponse(response)
         
     except Exception as e:
         return JSONResponse({"error": str(e)}, status_code=500)
@@ -136,27 +416,41 @@ async def transcribe_audio(file: UploadFile = File(...)):
 @app.get("/audio_files")
 async def list_audio_files():
     try:
-        files = [f for f in os.listdir(OUTPUT_DIR) if os.path.isfile(os.path.join(OUTPUT_DIR, f)) and f.endswith(".wav")]
-        files_info = [{"filename": f, "url": f"/audio/{f}"} for f in sorted(files)]
+        files_info = [{"filename": f, "url": f"/audio/{f}"} for f in sorted(audio_index)]
         return JSONResponse({"audio_files": files_info})
     except Exception as e:
         return JSONResponse({"error": str(e)}, status_code=500)
 
-@app.get("/play/{filename}")
+@app.get("/play/{filename:path}")
 async def play_audio(filename: str):
-    filepath = os.path.join(OUTPUT_DIR, filename)
-    if os.path.exists(filepath):
-        return FileResponse(filepath, media_type="audio/wav", filename=filename)
-    else:
+    # filename is a key from /audio_files ("<folder>/<file>.wav"); serve word WAVs inside OUTPUT_DIR only
+    filepath = os.path.realpath(os.path.join(OUTPUT_ROOT, filename))
+    try:
+        inside = os.path.commonpath([filepath, OUTPUT_ROOT]) == OUTPUT_ROOT
+    except ValueError:  # different drives on Windows
+        inside = False
+    if not inside or not WORD_FILE_NAME.fullmatch(os.path.basename(filepath)):
+        return JSONResponse({"error": "File not found"}, status_code=404)
+    try:
+        stat_result = os.stat(filepath)  # handed to FileResponse so it doesn't stat again
+    except FileNotFoundError:
+        return JSONResponse({"error": "File not found"}, status_code=404)
+    if not stat.S_ISREG(stat_result.st_mode):  # FileResponse skips its own regular-file check when given stat_result
         return JSONResponse({"error": "File not found"}, status_code=404)
+    return FileResponse(
+        filepath,
+        media_type="audio/wav",
+        filename=os.path.basename(filepath),
+        stat_result=stat_result,
+        # Word files get unique timestamped names and are never rewritten, so browsers can keep them
+        headers={"Cache-Control": "public, max-age=31536000, immutable"},
+    )
 
 @app.delete("/audio_files")
 async def clear_audio_files():
     try:
-        for f in os.listdir(OUTPUT_DIR):
-            path = os.path.join(OUTPUT_DIR, f)
-            if os.path.isfile(path):
-                os.remove(path)
+        audio_index.clear()
+        await asyncio.to_thread(clear_output_dir)
         return JSONResponse({"message": "All audio files cleared."})
     except Exception as e:
         return JSONResponse({"error": str(e)}, status_code=500)
@@ -167,10 +461,10 @@ async def root():
         "message": "Whisper Spanish Word Transcription API",
         "status": "running",
         "endpoints": {
-            "transcribe_sse": "POST /transcribe_sse",
-            "transcribe": "POST /transcribe",
+            "transcribe_sse": "POST /transcribe_sse?split_words=true",
+            "transcribe": "POST /transcribe?split_words=false",
             "list_files": "GET /audio_files",
-            "play_audio": "GET /play/{filename}",
+            "play_audio": "GET /play/{folder}/{filename}",
             "clear_files": "DELETE /audio_files"
         }
     }
@@ -179,4 +473,11 @@ async def root():
 if __name__ == "__main__":
     print(f"Server starting on http://127.0.0.1:8000")
     print(f"Word audio files will be saved in: {os.path.abspath(OUTPUT_DIR)}")
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    uvicorn.run(
+        "whisper_api:app" if WORKERS > 1 else app,  # multiple workers need an import string
+        host="0.0.0.0",
+        port=8000,
+        loop="asyncio" if os.name == "nt" else "uvloop",  # uvloop has no Windows build
+        http="httptools",
+        workers=WORKERS,
+    )